@@ -119,7 +119,7 @@ def cmd_transcribe(args):
         print("Nothing to transcribe.")
         return 0
 
-    # Two transcription modes:
+    # Three transcription modes:
     #
     # Subprocess-per-file (default): each file runs in its own process, torn down
     # on exit so the OS reclaims all memory between files. Essential on a
@@ -132,6 +132,15 @@ def cmd_transcribe(args):
     # once and the warm GPU kernels are reused — files 2..N run at the ~1.7x warm
     # rate. Worth it when RAM is ample (the model is ~3GB). Trade-off: a hard
     # crash takes down the whole run, and memory isn't reclaimed between files.
+    #
+    # Worker pool (--workers N): one process per GPU, each loading the model once
+    # and pulling files from a shared queue (crisperwhisper/faster-whisper only).
+    if getattr(args, "workers", None):
+        from auto_transcript import batch_worker_count
+        workers = batch_worker_count(args.engine, args.workers)
+        if workers > 1:
+            return _transcribe_multi_gpu(todo, args, workers)
+        return _transcribe_in_process(todo, args)
     if getattr(args, "in_process", False):
         return _transcribe_in_process(todo, args)
 
@@ -145,6 +154,8 @@ def cmd_transcribe(args):
             "--model", args.model,
             "--output-dir", str(m.parent),
         ]
+        if args.quantize:
+            cmd.append("--quantize")
         rc = subprocess.run(cmd).returncode
         if rc != 0:
             raise RuntimeError(f"transcription subprocess failed (exit {rc})")
@@ -178,6 +189,11 @@ def _run_batch(todo, label, do_one, verbose=False):
             failed.append((m.name, "no transcript written"))
             print(f"  ERROR: no transcript written for {m.name}", file=sys.stderr)
 
+    return _finish_batch(ok, failed)
+
+
+def _finish_batch(ok, failed):
+    """Print the transcribe summary; return the exit code."""
     print(f"\nDone: {ok} ok, {len(failed)} failed.")
     for name, err in failed:
         print(f"  FAILED {name}: {err}", file=sys.stderr)
@@ -187,22 +203,42 @@ def _run_batch(todo, label, do_one, verbose=False):
 def _transcribe_in_process(todo, args):
     """Transcribe all files in one process so the model/kernels stay warm.
 
-    Only helps the `crisperwhisper` engine (auto_transcript caches its pipeline
-    per-process, so files 2..N skip the load + GPU-warmup). `mlx` re-spawns a
-    .venv-mlx subprocess per file regardless, and `whisperx` is a CLI call — for
-    those this is equivalent to the default mode. A hard crash ends the whole run
-    (use the default subprocess mode for per-file isolation).
+    Only helps the `crisperwhisper` and `faster-whisper` engines (auto_transcript
+    caches their models per-process, so files 2..N skip the load + GPU-warmup).
+    `mlx` re-spawns a .venv-mlx subprocess per file regardless, and `whisperx` is
+    a CLI call — for those this is equivalent to the default mode. A hard crash
+    ends the whole run (use the default subprocess mode for per-file isolation).
     """
     from auto_transcript import transcribe
 
     def _in_process_one(m):
         transcribe(str(m), engine=args.engine, language=args.language,
-                   model=args.model, output_dir=str(m.parent))
+                   model=args.model, output_dir=str(m.parent),
+                   quantize=args.quantize)
 
     return _run_batch(todo, f"engine={args.engine}, in-process (model stays warm)",
                       _in_process_one, verbose=args.verbose)
 
 
+def _transcribe_multi_gpu(todo, args, workers):
+    """Transcribe with one warm worker process per GPU (auto_transcript.transcribe_batch)."""
+    from auto_transcript import transcribe_batch
+
+    print(f"\nTranscribing {len(todo)} file(s) (engine={args.engine}, "
+          f"{workers} GPU workers, model loaded once per GPU)...\n", flush=True)
+    results = transcribe_batch(todo, engine=args.engine, n_workers=workers,
+                               language=args.language, model=args.model,
+                               quantize=args.quantize)
+    ok, failed = 0, []
+    for m, _, err in results:
+        if err is None and file_state(m)["transcribed"]:
+            ok += 1
+        else:
+            failed.append((m.name, err or "no transcript written"))
+            print(f"  ERROR: {m.name}: {err or 'no transcript written'}", file=sys.stderr)
+    return _finish_batch(ok, failed)
+
+
 # ---------------------------------------------------------------------------
 # export
 # ---------------------------------------------------------------------------
@@ -336,15 +372,22 @@ def build_parser():
 
     pt = sub.add_parser("transcribe", parents=[common], help="Transcribe media")
     pt.add_argument("--engine", default="mlx",
-                    choices=["mlx", "crisperwhisper", "whisperx"],
+                    choices=["mlx", "crisperwhisper", "faster-whisper", "whisperx"],
                     help="Transcription engine (default: mlx)")
     pt.add_argument("--model", default="medium",
                     help="WhisperX model size (ignored for mlx/CrisperWhisper)")
     pt.add_argument("--language", default="en", help="Language code")
     pt.add_argument("--in-process", action="store_true",
                     help="Transcribe all files in one process so the model stays "
-                         "warm (crisperwhisper only; no effect for mlx/whisperx). "
+                         "warm (crisperwhisper/faster-whisper; no effect for "
+                         "mlx/whisperx). "
                          "Default: subprocess per file.")
+    pt.add_argument("--workers", type=int, default=None,
+                    help="Worker processes, one per GPU, each loading the model "
+                         "once (crisperwhisper/faster-whisper; capped at the "
+                         "visible GPU count). Default: off.")
+    pt.add_argument("--quantize", action="store_true",
+                    help="int8 dynamic quantization (crisperwhisper on cpu only)")
     pt.set_defaults(func=cmd_transcribe)
 
     px = sub.add_parser("export", parents=[common], help="Export edited SRTs")
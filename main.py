@@ -73,12 +73,14 @@ def main():
 
     # Transcription options
     parser.add_argument("--engine", default="mlx",
-                        choices=["mlx", "crisperwhisper", "whisperx"],
+                        choices=["mlx", "crisperwhisper", "faster-whisper", "whisperx"],
                         help="Transcription engine (default: mlx)")
     parser.add_argument("--model", default="medium",
                         help="WhisperX model size (ignored for CrisperWhisper)")
     parser.add_argument("--language", default="en", help="Language code")
     parser.add_argument("--output-dir", default=None, help="Transcription output directory")
+    parser.add_argument("--quantize", action="store_true",
+                        help="int8 dynamic quantization (crisperwhisper on cpu only)")
 
     args = parser.parse_args()
 
@@ -89,7 +91,8 @@ def main():
 
     if args.transcribe_only:
         transcribe(str(video), model=args.model, language=args.language,
-                   output_dir=args.output_dir, engine=args.engine)
+                   output_dir=args.output_dir, engine=args.engine,
+                   quantize=args.quantize)
         return
 
     edited_srt = Path(args.transcript).resolve() if args.transcript else video.with_suffix(".srt")
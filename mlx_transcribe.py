@@ -11,14 +11,14 @@ via two CrisperWhisper-specific pieces the naive MLX conversion drops —
      drops from seconds to ~20ms).
   2. Word grouping: CrisperWhisper marks word boundaries with standalone space
      tokens (not a leading space on each word token, as stock Whisper does), so
-     stock MLX over-splits words ("those" -> "tho se"). _crisper_split_to_word_
-     tokens regroups on the space tokens, restoring whole words.
+     stock MLX over-splits words ("those" -> "tho se").
+     auto_transcript._crisper_split_to_word_tokens regroups on the space tokens,
+     restoring whole words.
 
 Runs under .venv-mlx; auto_transcript shells out to it for engine="mlx".
 Emits the same .json / .srt / .srt.orig that transcribe_crisper does (it reuses
 auto_transcript's segment + SRT builders), so the rest of PaperCut is unchanged.
 """
-import sys
 from pathlib import Path
 
 import mlx.core as mx
@@ -32,6 +32,7 @@ from mlx_whisper.tokenizer import Tokenizer
 # lazily inside its functions, so importing the module here is cheap.)
 from auto_transcript import (
     _group_words_into_segments, _write_transcript_outputs, _make_progress,
+    _resolve_io, _crisper_split_to_word_tokens,
 )
 
 MODEL_DIR = str(Path(__file__).resolve().parent / "models" / "crisper-mlx-fp16")
@@ -45,53 +46,6 @@ ALIGNMENT_HEADS = np.array(
 )
 
 
-def _crisper_split_to_word_tokens(self, tokens):
-    """CrisperWhisper-aware word grouping for MLX's timing pass.
-
-    CrisperWhisper emits a standalone space token (one decoding to a lone ' ')
-    between words; pieces with no space token between them belong to the same word
-    (their own leading spaces stripped on join). Stock MLX splits on each token's
-    leading space, which over-splits. Each separator is kept as a TRAILING token
-    of the word it follows so a word's first token — and thus its DTW start time —
-    is its first real piece, keeping timestamps tight.
-    """
-    # Decode each token once — this runs per-segment in MLX's timing hot path,
-    # so the previous per-token re-decoding (in is_sep + the text join) was ~3-4x
-    # the work. is_sep[i] marks a standalone space token (a word boundary).
-    decoded = [self.decode([t]) for t in tokens]
-    is_sep = [t < self.eot and d == " " for t, d in zip(tokens, decoded)]
-
-    words, word_tokens = [], []
-    held = []                                  # leading separator(s) before a word
-    n = len(tokens)
-    i = 0
-    while i < n:
-        t = tokens[i]
-        if t >= self.eot:                      # special token -> its own entry
-            words.append(decoded[i])
-            word_tokens.append(held + [t])
-            held = []
-            i += 1
-            continue
-        if is_sep[i]:
-            if word_tokens:
-                word_tokens[-1].append(t)      # trailing separator -> previous word
-            else:
-                held.append(t)                 # leading separator -> hold for word 1
-            i += 1
-            continue
-        wt = held                              # word's tokens (held sep, then pieces)
-        held = []
-        text = " "                             # single leading space; pieces joined
-        while i < n and tokens[i] < self.eot and not is_sep[i]:
-            wt.append(tokens[i])
-            text += decoded[i].lstrip(" ")
-            i += 1
-        words.append(text)
-        word_tokens.append(wt)
-    return words, word_tokens
-
-
 _MODEL = None
 
 
@@ -120,13 +74,7 @@ def transcribe_mlx(video_path, language="en", output_dir=None, progress_callback
 
     Returns (json_path, srt_path, orig_srt_path), matching transcribe_crisper.
     """
-    video = Path(video_path).resolve()
-    if not video.exists():
-        print(f"Error: Video file not found: {video}", file=sys.stderr)
-        sys.exit(1)
-    out_dir = Path(output_dir).resolve() if output_dir else video.parent
-    out_dir.mkdir(parents=True, exist_ok=True)
-    stem = video.stem
+    video, out_dir, stem = _resolve_io(video_path, output_dir)
 
     _p = _make_progress(progress_callback)
     _p("Loading MLX CrisperWhisper model...")
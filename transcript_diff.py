@@ -1,154 +1,214 @@
 #!/usr/bin/env python3
 """Diff engine — compares original vs edited SRT and extracts cut ranges from WhisperX JSON."""
 
+import functools
 import json
 import re
 import sys
-from collections import namedtuple
+from collections import Counter, namedtuple
+
+import numpy as np
+
+try:
+    import orjson  # optional: ~3-5x faster on large word-level JSON
+except ImportError:
+    orjson = None
 
 SrtBlock = namedtuple("SrtBlock", ["index", "start", "end", "text"])
 
+# WhisperX segments normalized once per diff (see _index_segments).
+SegmentIndex = namedtuple("SegmentIndex", ["segments", "exact", "postings"])
+
+_TS_RE = re.compile(
+    r"(\d{1,2}:\d{2}:\d{2}[,\.]\d{3})\s*-->\s*(\d{1,2}:\d{2}:\d{2}[,\.]\d{3})")
+_SRT_TIME_RE = re.compile(r"(\d+):(\d{2}):(\d{2})\.(\d{3})")
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_WS_RE = re.compile(r"\s+")
+
 
 def parse_srt(filepath):
     """Parse an SRT file into a list of SrtBlocks.
 
     Handles messy edits: missing blank lines, non-sequential indices,
     extra whitespace, missing block numbers.
-    """
-    with open(filepath, "r", encoding="utf-8") as f:
-        content = f.read()
 
+    Streams the file line by line; a blank (or whitespace-only) line ends a block.
+    """
     blocks = []
-    # Split on blank lines (one or more)
-    raw_blocks = re.split(r"\n\s*\n", content.strip())
+    lines = []
+    with open(filepath, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                lines.append(line)
+            elif lines:
+                _append_srt_block(blocks, lines)
+                lines = []
+    if lines:
+        _append_srt_block(blocks, lines)
+    return blocks
 
-    for raw in raw_blocks:
-        lines = [line.strip() for line in raw.strip().split("\n") if line.strip()]
-        if not lines:
-            continue
 
-        # Find the timestamp line (contains " --> ")
-        ts_idx = None
-        for i, line in enumerate(lines):
-            if " --> " in line:
-                ts_idx = i
-                break
+def _append_srt_block(blocks, lines):
+    """Parse one block's non-blank, stripped lines and append it to blocks."""
+    # Find the timestamp line (contains " --> ")
+    ts_idx = None
+    for i, line in enumerate(lines):
+        if " --> " in line:
+            ts_idx = i
+            break
 
-        if ts_idx is None:
-            # No timestamp found — skip this block
-            print(f"Warning: Skipping block with no timestamp: {lines[:2]}", file=sys.stderr)
-            continue
+    if ts_idx is None:
+        # No timestamp found — skip this block
+        print(f"Warning: Skipping block with no timestamp: {lines[:2]}", file=sys.stderr)
+        return
 
-        # Parse index (line before timestamp, if present and numeric)
-        index = None
-        if ts_idx > 0:
-            try:
-                index = int(lines[ts_idx - 1])
-            except ValueError:
-                pass
-
-        # Parse timestamps
-        ts_match = re.match(
-            r"(\d{1,2}:\d{2}:\d{2}[,\.]\d{3})\s*-->\s*(\d{1,2}:\d{2}:\d{2}[,\.]\d{3})",
-            lines[ts_idx],
-        )
-        if not ts_match:
-            print(f"Warning: Skipping block with malformed timestamp: {lines[ts_idx]}", file=sys.stderr)
-            continue
+    # Parse index (line before timestamp, if present and numeric)
+    index = None
+    if ts_idx > 0:
+        try:
+            index = int(lines[ts_idx - 1])
+        except ValueError:
+            pass
 
-        start = _srt_time_to_seconds(ts_match.group(1))
-        end = _srt_time_to_seconds(ts_match.group(2))
+    # Parse timestamps
+    ts_match = _TS_RE.match(lines[ts_idx])
+    if not ts_match:
+        print(f"Warning: Skipping block with malformed timestamp: {lines[ts_idx]}", file=sys.stderr)
+        return
 
-        if start is None or end is None:
-            print(f"Warning: Skipping block with unparseable timestamp: {lines[ts_idx]}", file=sys.stderr)
-            continue
+    start = _srt_time_to_seconds(ts_match.group(1))
+    end = _srt_time_to_seconds(ts_match.group(2))
 
-        # Text is everything after the timestamp line
-        text_lines = lines[ts_idx + 1 :]
-        text = " ".join(text_lines)
+    if start is None or end is None:
+        print(f"Warning: Skipping block with unparseable timestamp: {lines[ts_idx]}", file=sys.stderr)
+        return
 
-        blocks.append(SrtBlock(index=index, start=start, end=end, text=text))
+    # Text is everything after the timestamp line
+    text = " ".join(lines[ts_idx + 1 :])
 
-    return blocks
+    blocks.append(SrtBlock(index=index, start=start, end=end, text=text))
 
 
 def _srt_time_to_seconds(ts):
     """Convert SRT timestamp (HH:MM:SS,mmm or HH:MM:SS.mmm) to seconds."""
-    ts = ts.replace(",", ".")
-    match = re.match(r"(\d+):(\d{2}):(\d{2})\.(\d{3})", ts)
+    # Fast path: the fixed-width form every engine writes — slice, no regex.
+    if len(ts) == 12 and ts[2] == ":" and ts[5] == ":" and ts[8] in ",.":
+        h, m, s, ms = ts[0:2], ts[3:5], ts[6:8], ts[9:12]
+        if h.isdecimal() and m.isdecimal() and s.isdecimal() and ms.isdecimal():
+            return int(h) * 3600 + int(m) * 60 + int(s) + int(ms) / 1000.0
+    match = _SRT_TIME_RE.match(ts.replace(",", "."))
     if not match:
         return None
     h, m, s, ms = int(match.group(1)), int(match.group(2)), int(match.group(3)), int(match.group(4))
     return h * 3600 + m * 60 + s + ms / 1000.0
 
 
+@functools.lru_cache(maxsize=4096)
 def _normalize_text(text):
-    """Normalize text for comparison: lowercase, collapse whitespace, strip punctuation."""
+    """Normalize text for comparison: lowercase, collapse whitespace, strip punctuation.
+
+    Memoized: the diff normalizes each segment's text once per deleted block.
+    """
     text = text.lower()
-    text = re.sub(r"[^\w\s]", "", text)
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _PUNCT_RE.sub("", text)
+    text = _WS_RE.sub(" ", text).strip()
     return text
 
 
 def load_whisper_json(filepath):
     """Load WhisperX JSON output."""
-    with open(filepath, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(filepath, "rb") as f:
+        data = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # WhisperX writes with json.dump, which emits NaN/Infinity for
+            # unscorable alignments; orjson rejects those, the stdlib doesn't.
+            pass
+    return json.loads(data.decode("utf-8"))
+
+
+def _index_segments(whisper_data):
+    """Normalize every WhisperX segment once, for repeated _find_segment_times lookups.
+
+    Returns a SegmentIndex:
+        segments: per segment, (norm_text, word_count, start, end), or None if
+            the text normalizes to nothing.
+        exact: normalized text -> indices of segments with exactly that text.
+        postings: word -> indices of segments containing that word.
+    """
+    segments, exact, postings = [], {}, {}
+    for i, seg in enumerate(whisper_data.get("segments", [])):
+        norm_seg = _normalize_text(seg.get("text", ""))
+        if not norm_seg:
+            segments.append(None)
+            continue
+        seg_words = norm_seg.split()
+        segments.append((norm_seg, len(seg_words), seg["start"], seg["end"]))
+        exact.setdefault(norm_seg, []).append(i)
+        for word in set(seg_words):
+            postings.setdefault(word, []).append(i)
+    return SegmentIndex(segments, exact, postings)
 
 
-def _find_segment_times(whisper_data, block_text, srt_start=None, claimed_segments=None):
+def _find_segment_times(seg_index, norm_block, block_words, srt_start=None,
+                        claimed_segments=None):
     """Find the best matching segment in WhisperX JSON for a given SRT block text.
 
     When multiple segments match the same text (duplicates), uses proximity to
     the SRT block's timestamp to pick the closest unclaimed segment.
 
     Args:
-        whisper_data: Parsed WhisperX JSON dict.
-        block_text: Text content of the SRT block.
+        seg_index: SegmentIndex of the WhisperX JSON (from _index_segments).
+        norm_block: The SRT block's text, already passed through _normalize_text.
+        block_words: norm_block.split(), computed once by the caller.
         srt_start: Start time from the SRT block (used for proximity matching).
         claimed_segments: Set of already-claimed segment indices (mutated in place).
 
     Returns (start, end) in seconds, or None if no match found.
     """
-    norm_block = _normalize_text(block_text)
     if not norm_block:
         return None
 
     if claimed_segments is None:
         claimed_segments = set()
 
-    segments = whisper_data.get("segments", [])
+    def _dist(seg_start):
+        return abs(seg_start - srt_start) if srt_start is not None else 0
+
     candidates = []  # (seg_index, start, end, match_quality, time_distance)
 
-    for i, seg in enumerate(segments):
-        if i in claimed_segments:
-            continue
+    # Exact match
+    for i in seg_index.exact.get(norm_block, ()):
+        if i not in claimed_segments:
+            _, _, start, end = seg_index.segments[i]
+            candidates.append((i, start, end, 1.0, _dist(start)))
 
-        seg_text = seg.get("text", "")
-        norm_seg = _normalize_text(seg_text)
-        if not norm_seg:
-            continue
+    # Containment/overlap match. A segment sharing no word with the block can't
+    # reach the 0.5 score floor, so only the block words' postings are visited —
+    # and counting them gives each segment's word overlap directly.
+    overlaps = Counter()
+    for word in set(block_words):
+        overlaps.update(seg_index.postings.get(word, ()))
 
-        # Exact match
+    for i, overlap in overlaps.items():
+        if i in claimed_segments:
+            continue
+        norm_seg, seg_word_count, start, end = seg_index.segments[i]
         if norm_seg == norm_block:
-            dist = abs(seg["start"] - srt_start) if srt_start is not None else 0
-            candidates.append((i, seg["start"], seg["end"], 1.0, dist))
             continue
-
-        # Containment/overlap match
-        if norm_block in norm_seg or norm_seg in norm_block:
-            overlap = len(set(norm_block.split()) & set(norm_seg.split()))
-            total = max(len(norm_block.split()), len(norm_seg.split()))
-            score = overlap / total if total > 0 else 0
-            if score >= 0.5:
-                dist = abs(seg["start"] - srt_start) if srt_start is not None else 0
-                candidates.append((i, seg["start"], seg["end"], score, dist))
+        score = overlap / max(len(block_words), seg_word_count)
+        if score >= 0.5 and (norm_block in norm_seg or norm_seg in norm_block):
+            candidates.append((i, start, end, score, _dist(start)))
 
     if not candidates:
         return None
 
-    # Sort by: best match quality (descending), then closest to SRT timestamp (ascending)
-    candidates.sort(key=lambda c: (-c[3], c[4]))
+    # Sort by: best match quality (descending), then closest to SRT timestamp
+    # (ascending), then segment order
+    candidates.sort(key=lambda c: (-c[3], c[4], c[0]))
     best = candidates[0]
     claimed_segments.add(best[0])
     return (best[1], best[2])
@@ -175,12 +235,13 @@ def find_deleted_ranges(original_srt, edited_srt, whisper_json):
     edited_blocks = parse_srt(edited_srt)
     whisper_data = load_whisper_json(whisper_json)
 
-    # Build a list of edited blocks available for matching (consumed as matched).
-    # Each entry: {norm_text, start, consumed}
-    edited_pool = [
-        {"norm": _normalize_text(b.text), "start": b.start, "consumed": False}
-        for b in edited_blocks
-    ]
+    # Bucket edited blocks by normalized text, each entry [start, consumed], in
+    # SRT order. An original block only ever competes with its own bucket, so
+    # the common case (text untouched, or gone entirely) is one dict lookup
+    # instead of a scan over every edited block.
+    edited_pool = {}
+    for b in edited_blocks:
+        edited_pool.setdefault(_normalize_text(b.text), []).append([b.start, False])
 
     # For each original block, find the best match in the edited pool by
     # normalized text + timestamp proximity.  This correctly handles duplicate
@@ -194,18 +255,18 @@ def find_deleted_ranges(original_srt, edited_srt, whisper_json):
 
         # Find all unconsumed edited blocks with matching text
         candidates = [
-            (i, abs(e["start"] - block.start))
-            for i, e in enumerate(edited_pool)
-            if not e["consumed"] and e["norm"] == norm
+            (e, abs(e[0] - block.start))
+            for e in edited_pool.get(norm, ())
+            if not e[1]
         ]
 
         if candidates:
-            # Pick the closest by timestamp
-            best_idx = min(candidates, key=lambda c: c[1])[0]
-            edited_pool[best_idx]["consumed"] = True
+            # Pick the closest by timestamp and consume it
+            best = min(candidates, key=lambda c: c[1])[0]
+            best[1] = True
         else:
-            # No match — this block was deleted
-            deleted_blocks.append(block)
+            # No match — this block was deleted (keep its normalized text)
+            deleted_blocks.append((block, norm))
 
     if not deleted_blocks:
         print("No deleted blocks found — nothing to cut.")
@@ -214,10 +275,12 @@ def find_deleted_ranges(original_srt, edited_srt, whisper_json):
     # Look up timestamps from JSON for each deleted block.
     # Track which JSON segments have been claimed so duplicate text
     # maps to distinct segments by proximity to the SRT block's timestamp.
+    seg_index = _index_segments(whisper_data)
     claimed_segments = set()  # indices into whisper_data["segments"]
     ranges = []
-    for block in deleted_blocks:
-        times = _find_segment_times(whisper_data, block.text, block.start, claimed_segments)
+    for block, norm in deleted_blocks:
+        times = _find_segment_times(seg_index, norm, norm.split(), block.start,
+                                    claimed_segments)
         if times:
             ranges.append(times)
         else:
@@ -237,19 +300,24 @@ def find_deleted_ranges(original_srt, edited_srt, whisper_json):
 
 
 def _merge_ranges(ranges):
-    """Merge overlapping or adjacent time ranges."""
+    """Merge overlapping or adjacent time ranges (input sorted by start).
+
+    A range opens a new group when it starts after the furthest end seen so far;
+    each group's end is the max over its members — a running max plus reduceat,
+    no per-range branching.
+    """
     if not ranges:
         return []
 
-    merged = [ranges[0]]
-    for start, end in ranges[1:]:
-        prev_start, prev_end = merged[-1]
-        if start <= prev_end:
-            merged[-1] = (prev_start, max(prev_end, end))
-        else:
-            merged.append((start, end))
+    arr = np.asarray(ranges, dtype=np.float64)
+    starts, ends = arr[:, 0], arr[:, 1]
+    new_group = np.empty(len(arr), dtype=bool)
+    new_group[0] = True
+    new_group[1:] = starts[1:] > np.maximum.accumulate(ends)[:-1]
+    group_starts = np.flatnonzero(new_group)
 
-    return merged
+    merged_ends = np.maximum.reduceat(ends, group_starts)
+    return list(zip(starts[group_starts].tolist(), merged_ends.tolist()))
 
 
 if __name__ == "__main__":
@@ -12,6 +12,7 @@ from pathlib import Path
 
 from flask import Flask, Response, jsonify, request, send_file, send_from_directory
 
+from auto_transcript import _format_srt
 from transcript_diff import find_deleted_ranges, parse_srt, load_whisper_json
 from papercut_core import export_from_blocks, DEFAULT_MARGIN, SILENCE_BRIDGE_S
 
@@ -44,6 +45,7 @@ def get_engines():
         "mlx": {"available": False, "label": "MLX CrisperWhisper (verbatim, fastest)"},
         "whisperx": {"available": False, "label": "WhisperX"},
         "crisperwhisper": {"available": False, "label": "CrisperWhisper (verbatim)"},
+        "faster-whisper": {"available": False, "label": "faster-whisper (CUDA/CPU, int8)"},
     }
 
     # Check MLX — needs the dedicated venv + converted model (see setup_mlx.sh)
@@ -87,6 +89,15 @@ def get_engines():
     if crisper_ok:
         engines["crisperwhisper"]["available"] = True
 
+    # Check faster-whisper
+    import importlib.util
+    if importlib.util.find_spec("faster_whisper"):
+        engines["faster-whisper"]["available"] = True
+    else:
+        engines["faster-whisper"]["reason"] = (
+            "faster-whisper not installed. Install with: pip install faster-whisper"
+        )
+
     return jsonify(engines)
 
 
@@ -135,8 +146,8 @@ def transcribe_sse():
     out_dir = video.parent
     stem = video.stem
 
-    if engine in ("mlx", "crisperwhisper"):
-        return _transcribe_engine_sse(video, out_dir, language, engine)
+    if engine in ("mlx", "crisperwhisper", "faster-whisper"):
+        return _transcribe_engine_sse(video, out_dir, language, engine, model)
 
     # Default: WhisperX via subprocess
     cmd = [
@@ -175,7 +186,7 @@ def transcribe_sse():
         # Copy original SRT for diffing
         if srt_path.exists() and not orig_srt_path.exists():
             import shutil
-            shutil.copy2(srt_path, orig_srt_path)
+            shutil.copyfile(srt_path, orig_srt_path)
 
         result = {
             "type": "done",
@@ -190,11 +201,13 @@ def transcribe_sse():
                     headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
 
 
-def _transcribe_engine_sse(video, out_dir, language, engine):
-    """Run an in-repo engine (mlx or crisperwhisper) with SSE progress streaming.
+def _transcribe_engine_sse(video, out_dir, language, engine, model="medium"):
+    """Run an in-repo engine (mlx, crisperwhisper, faster-whisper) with SSE progress.
 
     mlx shells out to .venv-mlx (works under any host python); crisperwhisper runs
-    in-process and needs torch + the nyrahealth transformers fork in THIS python.
+    in-process and needs torch + the nyrahealth transformers fork in THIS python;
+    faster-whisper runs in-process and needs the faster-whisper package (`model`
+    picks its stock Whisper size when the CrisperWhisper conversion is absent).
     """
     from auto_transcript import transcribe
     import queue
@@ -205,16 +218,18 @@ def _transcribe_engine_sse(video, out_dir, language, engine):
     def run_transcription():
         try:
             result = transcribe(
-                str(video), language=language, output_dir=str(out_dir),
-                engine=engine,
+                str(video), model=model, language=language,
+                output_dir=str(out_dir), engine=engine,
                 progress_callback=lambda msg: progress_queue.put(("progress", msg)),
             )
             progress_queue.put(("done", result))
         except Exception as e:
             progress_queue.put(("error", str(e)))
 
-    label = ("MLX CrisperWhisper (verbatim)" if engine == "mlx"
-             else "CrisperWhisper (verbatim mode)")
+    label = {
+        "mlx": "MLX CrisperWhisper (verbatim)",
+        "faster-whisper": "faster-whisper",
+    }.get(engine, "CrisperWhisper (verbatim mode)")
 
     def generate():
         yield f"data: {json.dumps({'type': 'start', 'message': f'Starting {label}...'})}\n\n"
@@ -281,10 +296,7 @@ def diff_transcript():
     # Write kept blocks to a temp SRT file
     tmp = tempfile.NamedTemporaryFile(mode="w", suffix=".srt", delete=False, encoding="utf-8")
     try:
-        for i, block in enumerate(kept_blocks, 1):
-            start_ts = _seconds_to_srt_time(block["start"])
-            end_ts = _seconds_to_srt_time(block["end"])
-            tmp.write(f"{i}\n{start_ts} --> {end_ts}\n{block['text']}\n\n")
+        tmp.write(_format_srt(kept_blocks))
         tmp.close()
 
         deleted_ranges = find_deleted_ranges(orig_srt_path, tmp.name, json_path)
@@ -354,16 +366,6 @@ def export_video():
         return jsonify({"success": False, "error": str(e)})
 
 
-def _seconds_to_srt_time(seconds):
-    """Convert seconds to SRT timestamp format HH:MM:SS,mmm."""
-    h = int(seconds // 3600)
-    m = int((seconds % 3600) // 60)
-    s = seconds % 60
-    whole_s = int(s)
-    ms = int(round((s - whole_s) * 1000))
-    return f"{h:02d}:{m:02d}:{whole_s:02d},{ms:03d}"
-
-
 def main():
     parser = argparse.ArgumentParser(description="Web GUI for PaperCut")
     parser.add_argument("--port", type=int, default=5000, help="Port to run on (default: 5000)")